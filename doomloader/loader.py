@@ -5,36 +5,52 @@ Handles loading various audio file formats.
 """
 
 import os
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, Tuple, BinaryIO
 
 
 class AudioLoader:
     """Load and manage audio files in various formats."""
     
+    _SUPPORTED_FORMATS = ('.wav', '.mp3', '.ogg', '.flac', '.m4a')
+    
     def __init__(self):
         """Initialize the AudioLoader."""
-        self.supported_formats = ['.wav', '.mp3', '.ogg', '.flac', '.m4a']
+        self._supported_formats_set = frozenset(self.supported_formats)
         self.loaded_files = {}
     
-    def load(self, file_path: str) -> Dict[str, Any]:
+    @property
+    def supported_formats(self) -> Tuple[str, ...]:
+        """Supported audio formats, in display order (read-only)."""
+        return self._SUPPORTED_FORMATS
+    
+    def load(self, source: Union[str, bytes, os.PathLike, BinaryIO]) -> Dict[str, Any]:
         """
         Load an audio file.
         
         Args:
-            file_path: Path to the audio file
+            source: Path to the audio file (str, bytes or path object), or
+                an open binary file object whose ``name`` attribute carries
+                the file name (e.g. a ``BytesIO`` with ``name`` set)
             
         Returns:
             Dictionary containing audio data and metadata
             
         Raises:
             FileNotFoundError: If the file doesn't exist
-            ValueError: If the file format is not supported
+            ValueError: If the file format is not supported, or a file
+                object has no usable ``name``
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Audio file not found: {file_path}")
+        if isinstance(source, (str, bytes, os.PathLike)):
+            file_path = os.fsdecode(source)
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(f"Audio file not found: {file_path}")
+        else:
+            file_path = getattr(source, 'name', None)
+            if not isinstance(file_path, str):
+                raise ValueError("File object audio source must have a string 'name' attribute")
         
-        file_ext = os.path.splitext(file_path)[1].lower()
-        if file_ext not in self.supported_formats:
+        file_ext = self._ext(file_path)
+        if file_ext not in self._supported_formats_set:
             raise ValueError(f"Unsupported audio format: {file_ext}")
         
         # TODO: Implement actual audio loading logic
@@ -53,9 +69,13 @@ class AudioLoader:
     
     def get_supported_formats(self) -> list:
         """Get list of supported audio formats."""
-        return self.supported_formats.copy()
+        return list(self.supported_formats)
     
     def is_supported(self, file_path: str) -> bool:
         """Check if a file format is supported."""
-        file_ext = os.path.splitext(file_path)[1].lower()
-        return file_ext in self.supported_formats
\ No newline at end of file
+        return self._ext(file_path) in self._supported_formats_set
+    
+    @staticmethod
+    def _ext(file_path: str) -> str:
+        """Return the lowercased extension of a file path."""
+        return os.path.splitext(file_path)[1].lower()
\ No newline at end of file
@@ -4,19 +4,27 @@ Audio processor module for DOOMLOADER
 Handles audio processing and effects application.
 """
 
-from typing import Dict, Any, Optional, List
+import sys
+from typing import Dict, Any, Optional, List, Tuple
 
 
 class AudioProcessor:
     """Process audio data with various effects and transformations."""
     
+    _AVAILABLE_EFFECTS = (
+        'reverb', 'delay', 'distortion', 'equalizer', 'compressor'
+    )
+    
     def __init__(self):
         """Initialize the AudioProcessor."""
-        self.available_effects = [
-            'reverb', 'delay', 'distortion', 'equalizer', 'compressor'
-        ]
+        self._available_effects_set = frozenset(self.available_effects)
         self.effect_chain = []
     
+    @property
+    def available_effects(self) -> Tuple[str, ...]:
+        """Available effect names, in display order (read-only)."""
+        return self._AVAILABLE_EFFECTS
+    
     def add_effect(self, effect_name: str, parameters: Optional[Dict[str, Any]] = None) -> None:
         """
         Add an effect to the processing chain.
@@ -28,11 +36,11 @@ class AudioProcessor:
         Raises:
             ValueError: If effect is not supported
         """
-        if effect_name not in self.available_effects:
+        if effect_name not in self._available_effects_set:
             raise ValueError(f"Unsupported effect: {effect_name}")
         
         effect_config = {
-            'name': effect_name,
+            'name': self._intern_name(effect_name),
             'parameters': parameters or {}
         }
         self.effect_chain.append(effect_config)
@@ -47,6 +55,8 @@ class AudioProcessor:
         Returns:
             True if effect was removed, False if not found
         """
+        if isinstance(effect_name, str):
+            effect_name = self._intern_name(effect_name)
         for i, effect in enumerate(self.effect_chain):
             if effect['name'] == effect_name:
                 self.effect_chain.pop(i)
@@ -57,6 +67,9 @@ class AudioProcessor:
         """
         Process audio data through the effect chain.
         
+        The input dictionary is copied shallowly, so the audio buffer under
+        'data' is shared with the result rather than duplicated.
+        
         Args:
             audio_data: Audio data dictionary from AudioLoader
             
@@ -73,7 +86,7 @@ class AudioProcessor:
     
     def get_available_effects(self) -> List[str]:
         """Get list of available effects."""
-        return self.available_effects.copy()
+        return list(self.available_effects)
     
     def clear_effects(self) -> None:
         """Clear all effects from the processing chain."""
@@ -81,4 +94,16 @@ class AudioProcessor:
     
     def get_effect_chain(self) -> List[Dict[str, Any]]:
         """Get the current effect chain."""
-        return self.effect_chain.copy()
\ No newline at end of file
+        return self.effect_chain.copy()
+    
+    @staticmethod
+    def _intern_name(effect_name: str) -> str:
+        """
+        Return the interned plain-str form of an effect name.
+        
+        Names stored in the chain and names passed to remove_effect are both
+        interned, so their == comparison takes CPython's identity fast path.
+        str.__str__ is used rather than str() so str subclasses such as
+        str-mixin Enum members yield their value, not "Class.member".
+        """
+        return sys.intern(str.__str__(effect_name))
\ No newline at end of file
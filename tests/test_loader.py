@@ -3,69 +3,135 @@ Tests for the AudioLoader module
 """
 
 import pytest
-import os
-import tempfile
+import io
 from doomloader.loader import AudioLoader
 
 
-class TestAudioLoader:
-    """Test cases for AudioLoader class."""
+@pytest.fixture(scope="module")
+def loader():
+    """Provide an AudioLoader shared across the module."""
+    return AudioLoader()
+
+
+@pytest.fixture(autouse=True)
+def reset_loader(loader):
+    """Start every test with no loaded files."""
+    loader.loaded_files.clear()
+
+
+def test_initialization(loader):
+    """Test AudioLoader initialization."""
+    assert loader is not None
+    assert len(loader.supported_formats) > 0
+    assert '.wav' in loader.supported_formats
+    assert '.mp3' in loader.supported_formats
+
+
+def test_get_supported_formats(loader):
+    """Test getting supported formats."""
+    formats = loader.get_supported_formats()
+    assert isinstance(formats, list)
+    assert len(formats) > 0
+    assert '.wav' in formats
+
+
+def test_supported_formats_agree_with_is_supported(loader):
+    """Test that every advertised format is accepted."""
+    for fmt in loader.get_supported_formats():
+        assert loader.is_supported(f'test{fmt}') is True
+        assert loader.is_supported(f'test{fmt.upper()}') is True
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.loader = AudioLoader()
+    class AiffLoader(AudioLoader):
+        supported_formats = ('.wav', '.aiff')
     
-    def test_initialization(self):
-        """Test AudioLoader initialization."""
-        assert self.loader is not None
-        assert len(self.loader.supported_formats) > 0
-        assert '.wav' in self.loader.supported_formats
-        assert '.mp3' in self.loader.supported_formats
+    aiff_loader = AiffLoader()
+    assert aiff_loader.get_supported_formats() == ['.wav', '.aiff']
+    assert aiff_loader.is_supported('test.aiff') is True
+    assert aiff_loader.is_supported('test.mp3') is False
     
-    def test_get_supported_formats(self):
-        """Test getting supported formats."""
-        formats = self.loader.get_supported_formats()
-        assert isinstance(formats, list)
-        assert len(formats) > 0
-        assert '.wav' in formats
+    with pytest.raises(AttributeError):
+        loader.supported_formats = ['.wav', '.aiff']
+
+
+def test_is_supported(loader):
+    """Test format support checking."""
+    assert loader.is_supported('test.wav') is True
+    assert loader.is_supported('test.mp3') is True
+    assert loader.is_supported('test.xyz') is False
+
+
+def test_load_nonexistent_file(loader):
+    """Test loading a non-existent file."""
+    with pytest.raises(FileNotFoundError):
+        loader.load('/nonexistent/file.wav')
+
+
+def test_load_unsupported_format(loader, tmp_path):
+    """Test loading an unsupported format."""
+    temp_path = tmp_path / 'test.xyz'
+    temp_path.write_bytes(b'dummy content')
     
-    def test_is_supported(self):
-        """Test format support checking."""
-        assert self.loader.is_supported('test.wav') is True
-        assert self.loader.is_supported('test.mp3') is True
-        assert self.loader.is_supported('test.xyz') is False
+    with pytest.raises(ValueError):
+        loader.load(str(temp_path))
+
+
+def test_load_supported_format(loader, tmp_path):
+    """Test loading a supported format file (placeholder implementation)."""
+    temp_path = tmp_path / 'test.wav'
+    temp_path.write_bytes(b'dummy wav content')
+    
+    audio_data = loader.load(str(temp_path))
+    assert isinstance(audio_data, dict)
+    assert audio_data['file_path'] == str(temp_path)
+    assert audio_data['format'] == '.wav'
+    assert 'sample_rate' in audio_data
+    assert 'channels' in audio_data
+
+
+def test_load_path_object(loader, tmp_path):
+    """Test loading a file given as a path object."""
+    temp_path = tmp_path / 'test.flac'
+    temp_path.write_bytes(b'dummy flac content')
+    
+    audio_data = loader.load(temp_path)
+    assert audio_data['file_path'] == str(temp_path)
+    assert audio_data['format'] == '.flac'
+
+
+def test_load_bytes_path(loader, tmp_path):
+    """Test loading a file given as a bytes path."""
+    temp_path = tmp_path / 'test.ogg'
+    temp_path.write_bytes(b'dummy ogg content')
     
-    def test_load_nonexistent_file(self):
-        """Test loading a non-existent file."""
-        with pytest.raises(FileNotFoundError):
-            self.loader.load('/nonexistent/file.wav')
+    audio_data = loader.load(bytes(temp_path))
+    assert audio_data['file_path'] == str(temp_path)
+    assert audio_data['format'] == '.ogg'
     
-    def test_load_unsupported_format(self):
-        """Test loading an unsupported format."""
-        # Create a temporary file with unsupported extension
-        with tempfile.NamedTemporaryFile(suffix='.xyz', delete=False) as tmp:
-            tmp.write(b'dummy content')
-            temp_path = tmp.name
-        
-        try:
-            with pytest.raises(ValueError):
-                self.loader.load(temp_path)
-        finally:
-            os.unlink(temp_path)
+    with pytest.raises(FileNotFoundError):
+        loader.load(b'/nonexistent/file.wav')
+
+
+def test_load_file_object(loader):
+    """Test loading from an in-memory file object."""
+    buf = io.BytesIO(b'dummy wav content')
+    buf.name = 'test.wav'
     
-    def test_load_supported_format(self):
-        """Test loading a supported format file (placeholder implementation)."""
-        # Create a temporary file with supported extension
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-            tmp.write(b'dummy wav content')
-            temp_path = tmp.name
-        
-        try:
-            audio_data = self.loader.load(temp_path)
-            assert isinstance(audio_data, dict)
-            assert audio_data['file_path'] == temp_path
-            assert audio_data['format'] == '.wav'
-            assert 'sample_rate' in audio_data
-            assert 'channels' in audio_data
-        finally:
-            os.unlink(temp_path)
\ No newline at end of file
+    audio_data = loader.load(buf)
+    assert audio_data['file_path'] == 'test.wav'
+    assert audio_data['format'] == '.wav'
+    assert loader.loaded_files['test.wav'] is audio_data
+
+
+def test_load_file_object_unsupported_format(loader):
+    """Test loading a file object with an unsupported format."""
+    buf = io.BytesIO(b'dummy content')
+    buf.name = 'test.xyz'
+    
+    with pytest.raises(ValueError):
+        loader.load(buf)
+
+
+def test_load_file_object_without_name(loader):
+    """Test loading a file object that has no name."""
+    with pytest.raises(ValueError):
+        loader.load(io.BytesIO(b'dummy content'))
\ No newline at end of file
@@ -3,82 +3,134 @@ Tests for the AudioProcessor module
 """
 
 import pytest
+import sys
+from enum import Enum
 from doomloader.processor import AudioProcessor
 
 
+@pytest.fixture(scope="class")
+def processor():
+    """Provide an AudioProcessor shared across a test class."""
+    return AudioProcessor()
+
+
 class TestAudioProcessor:
     """Test cases for AudioProcessor class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.processor = AudioProcessor()
+    @pytest.fixture(autouse=True)
+    def reset_processor(self, processor):
+        """Start every test with an empty effect chain."""
+        processor.clear_effects()
     
-    def test_initialization(self):
+    def test_initialization(self, processor):
         """Test AudioProcessor initialization."""
-        assert self.processor is not None
-        assert len(self.processor.available_effects) > 0
-        assert 'reverb' in self.processor.available_effects
-        assert len(self.processor.effect_chain) == 0
+        assert processor is not None
+        assert len(processor.available_effects) > 0
+        assert 'reverb' in processor.available_effects
+        assert len(processor.effect_chain) == 0
     
-    def test_get_available_effects(self):
+    def test_get_available_effects(self, processor):
         """Test getting available effects."""
-        effects = self.processor.get_available_effects()
+        effects = processor.get_available_effects()
         assert isinstance(effects, list)
         assert len(effects) > 0
         assert 'reverb' in effects
         assert 'delay' in effects
     
-    def test_add_effect(self):
+    def test_available_effects_agree_with_add_effect(self, processor):
+        """Test that advertised effects and validation cannot disagree."""
+        for effect in processor.get_available_effects():
+            processor.add_effect(effect)
+        
+        class ChorusProcessor(AudioProcessor):
+            available_effects = ('reverb', 'chorus')
+        
+        chorus_processor = ChorusProcessor()
+        assert chorus_processor.get_available_effects() == ['reverb', 'chorus']
+        chorus_processor.add_effect('chorus')
+        with pytest.raises(ValueError):
+            chorus_processor.add_effect('delay')
+        
+        with pytest.raises(AttributeError):
+            processor.available_effects = ['reverb', 'chorus']
+    
+    def test_add_effect(self, processor):
         """Test adding effects to the chain."""
-        self.processor.add_effect('reverb')
-        assert len(self.processor.effect_chain) == 1
-        assert self.processor.effect_chain[0]['name'] == 'reverb'
+        processor.add_effect('reverb')
+        assert len(processor.effect_chain) == 1
+        assert processor.effect_chain[0]['name'] == 'reverb'
         
         # Add with parameters
-        self.processor.add_effect('delay', {'time': 0.5})
-        assert len(self.processor.effect_chain) == 2
-        assert self.processor.effect_chain[1]['parameters']['time'] == 0.5
+        processor.add_effect('delay', {'time': 0.5})
+        assert len(processor.effect_chain) == 2
+        assert processor.effect_chain[1]['parameters']['time'] == 0.5
+    
+    def test_add_effect_interns_name(self, processor):
+        """Test that stored effect names are interned."""
+        name = ''.join(['rev', 'erb'])
+        processor.add_effect(name)
+        assert processor.effect_chain[0]['name'] is sys.intern(name)
     
-    def test_add_unsupported_effect(self):
+    def test_add_effect_str_subclass(self, processor):
+        """Test adding and removing effects named by a str-mixin Enum."""
+        class Effect(str, Enum):
+            REVERB = 'reverb'
+        
+        processor.add_effect(Effect.REVERB)
+        name = processor.effect_chain[0]['name']
+        assert type(name) is str
+        assert name == 'reverb'
+        assert name is sys.intern('reverb')
+        
+        assert processor.remove_effect(Effect.REVERB) is True
+        assert len(processor.effect_chain) == 0
+    
+    def test_remove_effect_deserialized_name(self, processor):
+        """Test removing an effect by a name built at runtime."""
+        processor.add_effect('delay')
+        assert processor.remove_effect(''.join(['del', 'ay'])) is True
+        assert processor.remove_effect(None) is False
+    
+    def test_add_unsupported_effect(self, processor):
         """Test adding an unsupported effect."""
         with pytest.raises(ValueError):
-            self.processor.add_effect('unsupported_effect')
+            processor.add_effect('unsupported_effect')
     
-    def test_remove_effect(self):
+    def test_remove_effect(self, processor):
         """Test removing effects from the chain."""
-        self.processor.add_effect('reverb')
-        self.processor.add_effect('delay')
+        processor.add_effect('reverb')
+        processor.add_effect('delay')
         
-        result = self.processor.remove_effect('reverb')
+        result = processor.remove_effect('reverb')
         assert result is True
-        assert len(self.processor.effect_chain) == 1
-        assert self.processor.effect_chain[0]['name'] == 'delay'
+        assert len(processor.effect_chain) == 1
+        assert processor.effect_chain[0]['name'] == 'delay'
         
         # Try to remove non-existent effect
-        result = self.processor.remove_effect('nonexistent')
+        result = processor.remove_effect('nonexistent')
         assert result is False
     
-    def test_clear_effects(self):
+    def test_clear_effects(self, processor):
         """Test clearing all effects."""
-        self.processor.add_effect('reverb')
-        self.processor.add_effect('delay')
-        assert len(self.processor.effect_chain) == 2
+        processor.add_effect('reverb')
+        processor.add_effect('delay')
+        assert len(processor.effect_chain) == 2
         
-        self.processor.clear_effects()
-        assert len(self.processor.effect_chain) == 0
+        processor.clear_effects()
+        assert len(processor.effect_chain) == 0
     
-    def test_get_effect_chain(self):
+    def test_get_effect_chain(self, processor):
         """Test getting the effect chain."""
-        self.processor.add_effect('reverb')
-        self.processor.add_effect('delay', {'time': 0.3})
+        processor.add_effect('reverb')
+        processor.add_effect('delay', {'time': 0.3})
         
-        chain = self.processor.get_effect_chain()
+        chain = processor.get_effect_chain()
         assert len(chain) == 2
         assert chain[0]['name'] == 'reverb'
         assert chain[1]['name'] == 'delay'
         assert chain[1]['parameters']['time'] == 0.3
     
-    def test_process_audio(self):
+    def test_process_audio(self, processor):
         """Test processing audio data."""
         # Mock audio data
         audio_data = {
@@ -89,14 +141,24 @@ class TestAudioProcessor:
             'data': 'mock_audio_data'
         }
         
-        self.processor.add_effect('reverb')
-        self.processor.add_effect('delay')
+        processor.add_effect('reverb')
+        processor.add_effect('delay')
         
-        processed = self.processor.process(audio_data)
+        processed = processor.process(audio_data)
         
         assert processed is not None
         assert 'effects_applied' in processed
         assert 'processing_chain' in processed
         assert 'reverb' in processed['effects_applied']
         assert 'delay' in processed['effects_applied']
-        assert len(processed['processing_chain']) == 2
\ No newline at end of file
+        assert len(processed['processing_chain']) == 2
+    
+    def test_process_shares_audio_buffer(self, processor):
+        """Test that processing does not duplicate the audio buffer."""
+        samples = [0.0, 0.5, -0.5]
+        audio_data = {'file_path': 'test.wav', 'data': samples}
+        
+        processed = processor.process(audio_data)
+        
+        assert processed is not audio_data
+        assert processed['data'] is samples
\ No newline at end of file